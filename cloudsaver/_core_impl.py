@@ -3,14 +3,15 @@ from __future__ import annotations
 import argparse
 import fnmatch
 import hashlib
+import itertools
 import json
 import mimetypes
 import os
 import shutil
 import subprocess
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import asdict, dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from html import escape
 from pathlib import Path
 from typing import Callable, Iterable, List
@@ -37,6 +38,15 @@ except ImportError:
     piexif = None
     PIEXIF_AVAILABLE = False
 
+# Optional: install with `python -m pip install "cloudsaver[fast_json]"`.
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 # Optional: install with `python -m pip install "cloudsaver[image_extras]"`.
 try:
     import imagehash
@@ -91,6 +101,9 @@ if AVIF_AVAILABLE:
     SUPPORTED_IMAGE_MIME_TYPES.add("image/avif")
 DEFAULT_IMAGE_QUALITY = 82
 HASH_CHUNK_SIZE = 1024 * 1024
+HASH_WORKERS = 8
+PERCEPTUAL_HASH_DRAFT_SIZE = (256, 256)
+SCAN_PROGRESS_PRINT_INTERVAL = 1000
 OXIPNG_AVAILABLE = shutil.which("oxipng") is not None
 FFPROBE_AVAILABLE = shutil.which("ffprobe") is not None
 
@@ -108,14 +121,16 @@ class LocalFile:
     parents: List[str]
 
 
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def human_readable_size(size_bytes: int) -> str:
     """Convert byte counts into a human-readable string."""
 
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.2f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+    unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit_index)):.2f} {SIZE_UNITS[unit_index]}"
 
 
 def estimate_monthly_storage_cost_usd(
@@ -181,9 +196,11 @@ def hash_file_sha256(path: str | Path) -> str:
     """Return a SHA-256 digest for a local file."""
 
     digest = hashlib.sha256()
-    with open(path, "rb") as file:
-        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
-            digest.update(chunk)
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as file:
+        while size := file.readinto(buffer):
+            digest.update(view[:size])
     return digest.hexdigest()
 
 
@@ -206,6 +223,25 @@ def hash_file_partial(
     return digest.hexdigest()
 
 
+def _hash_files_concurrently(
+    executor: ThreadPoolExecutor,
+    files: list[dict],
+    hash_function: Callable[[str], str],
+) -> tuple[dict[int, str], dict[int, OSError]]:
+    """Hash files on ``executor`` and return digests and errors keyed by ``id(file)``."""
+
+    digests: dict[int, str] = {}
+    errors: dict[int, OSError] = {}
+    future_map = {executor.submit(hash_function, file.get("path") or ""): file for file in files}
+    for future in as_completed(future_map):
+        file = future_map[future]
+        try:
+            digests[id(file)] = future.result()
+        except OSError as error:
+            errors[id(file)] = error
+    return digests, errors
+
+
 def probe_media_file(path: str | Path) -> dict | None:
     """Return ffprobe JSON for a media file, or None when probing is unavailable."""
 
@@ -428,16 +464,15 @@ def scan_local_folder(
             )
             if SMART_SCAN_FOUNDATION and inode_key[0] is not None and inode_key[1] is not None:
                 seen_inodes.add(inode_key)
-            local_file = LocalFile(
-                id=relative_id,
-                name=path.name,
-                path=str(path),
-                size_bytes=stat.st_size,
-                mimeType=guess_mime_type(path),
-                included=not hardlink,
-                parents=[parent],
-            )
-            file_dict = asdict(local_file)
+            file_dict = {
+                "id": relative_id,
+                "name": path.name,
+                "path": str(path),
+                "size_bytes": stat.st_size,
+                "mimeType": guess_mime_type(path),
+                "included": not hardlink,
+                "parents": [parent],
+            }
             if SMART_SCAN_FOUNDATION:
                 file_dict.update(
                     {
@@ -469,7 +504,7 @@ def scan_local_folder(
                         "cache_hits": cache_hits,
                     }
                 )
-            if count % 50 == 0:
+            if count % SCAN_PROGRESS_PRINT_INTERVAL == 0:
                 print(f"   ...{count} files scanned")
 
     if not files:
@@ -488,6 +523,19 @@ def scan_local_folder(
     return files
 
 
+def exceeds_resolution(file: dict, max_resolution: tuple[int, int] = HD_RESOLUTION) -> bool:
+    """Return whether a file's known image dimensions exceed ``max_resolution``.
+
+    Files without dimension metadata are assumed to exceed it.
+    """
+
+    width = file.get("width")
+    height = file.get("height")
+    if not width or not height:
+        return True
+    return width > max_resolution[0] or height > max_resolution[1]
+
+
 def estimate_reduction_for_file(
     file: dict,
     max_resolution: tuple[int, int] = HD_RESOLUTION,
@@ -568,14 +616,23 @@ def attach_duplicate_verification(
     files: Iterable[dict],
     cache_db_path: str | Path | None = None,
 ) -> List[dict]:
-    """Hash duplicate candidates so readable matches can be treated as verified."""
+    """Hash duplicate candidates so readable matches can be treated as verified.
+
+    Files that already carry a provider ``md5`` checksum, such as Google Drive
+    listings, are checked against that checksum without reading any content:
+    shared checksums are verified and unique ones are rejected.
+    """
 
     normalized_files = list(files)
     candidate_groups = {}
+    md5_groups = {}
     for file in normalized_files:
         size_bytes = int(file.get("size_bytes", 0) or 0)
         if size_bytes <= 0 or file.get("is_sparse") or file.get("included") is False:
             continue
+        if file.get("md5"):
+            md5_groups.setdefault(file["md5"], []).append(file)
+            continue
         key = (file.get("name") or "Untitled", size_bytes)
         candidate_groups.setdefault(key, []).append(file)
 
@@ -585,31 +642,62 @@ def attach_duplicate_verification(
         if len(group) > 1
         for file in group
     }
+    md5_candidate_ids = {id(file) for group in md5_groups.values() for file in group}
     partial_candidates = set()
-    if SMART_SCAN_FOUNDATION:
-        for group in candidate_groups.values():
-            if len(group) <= 1:
-                continue
-            if any(file.get("cached_hash") for file in group):
-                partial_candidates.update(id(file) for file in group)
-                continue
-            partial_groups = {}
-            for file in group:
-                try:
-                    partial_hash = hash_file_partial(file.get("path") or "")
-                except OSError:
-                    partial_hash = None
-                if partial_hash:
-                    partial_groups.setdefault(partial_hash, []).append(file)
-            partial_candidates.update(
-                id(file)
-                for partial_group in partial_groups.values()
-                if len(partial_group) > 1
-                for file in partial_group
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+        if SMART_SCAN_FOUNDATION:
+            partial_hash_groups = []
+            for group in candidate_groups.values():
+                if len(group) <= 1:
+                    continue
+                if any(file.get("cached_hash") for file in group):
+                    partial_candidates.update(id(file) for file in group)
+                    continue
+                partial_hash_groups.append(group)
+            partial_hashes, _ = _hash_files_concurrently(
+                executor,
+                [file for group in partial_hash_groups for file in group],
+                hash_file_partial,
             )
+            for group in partial_hash_groups:
+                partial_groups = {}
+                for file in group:
+                    partial_hash = partial_hashes.get(id(file))
+                    if partial_hash:
+                        partial_groups.setdefault(partial_hash, []).append(file)
+                partial_candidates.update(
+                    id(file)
+                    for partial_group in partial_groups.values()
+                    if len(partial_group) > 1
+                    for file in partial_group
+                )
+
+        content_hashes, hash_errors = _hash_files_concurrently(
+            executor,
+            [
+                file
+                for file in normalized_files
+                if id(file) in candidate_ids
+                and not file.get("cached_hash")
+                and (not SMART_SCAN_FOUNDATION or id(file) in partial_candidates)
+            ],
+            hash_file_sha256,
+        )
 
     verified_files = []
     for file in normalized_files:
+        if id(file) in md5_candidate_ids:
+            verified_files.append(
+                {
+                    **file,
+                    "duplicate_verification": {
+                        "status": "verified" if len(md5_groups[file["md5"]]) > 1 else "rejected",
+                        "algorithm": "md5",
+                        "content_hash": file["md5"],
+                    },
+                }
+            )
+            continue
         if id(file) not in candidate_ids:
             verified_files.append(file)
             continue
@@ -625,21 +713,20 @@ def attach_duplicate_verification(
             )
             continue
 
-        path = file.get("path") or ""
-        try:
-            content_hash = file.get("cached_hash") or hash_file_sha256(path)
-        except OSError as error:
+        if id(file) in hash_errors:
             verified_files.append(
                 {
                     **file,
                     "duplicate_verification": {
                         "status": "unverified",
-                        "reason": str(error),
+                        "reason": str(hash_errors[id(file)]),
                     },
                 }
             )
             continue
 
+        content_hash = file.get("cached_hash") or content_hashes[id(file)]
+
         verified_files.append(
             {
                 **file,
@@ -661,18 +748,43 @@ def attach_duplicate_verification(
     return verified_files
 
 
+def _write_json(path: str, data) -> None:
+    """Write indented JSON to ``path``, using orjson when it is installed."""
+
+    with open(path, "wb") as f:
+        f.write(_dump_json_bytes(data))
+
+
+def _dump_json_bytes(data) -> bytes:
+    """Serialize ``data`` as indented JSON bytes.
+
+    orjson writes non-ASCII text as raw UTF-8 where stdlib json emits
+    ``\\uXXXX`` escapes; both decode to the same values.
+    """
+
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode()
+
+
 def export_to_json_file(data: Iterable[dict], filename: str) -> None:
-    """Serialize ``data`` to ``OUTPUT_DIR/filename`` as JSON."""
+    """Stream ``data`` to ``OUTPUT_DIR/filename`` as a JSON array, one record at a time."""
 
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     filename = os.path.join(OUTPUT_DIR, filename)
-    data = list(data)
-    if not data:
+    records = iter(data)
+    first_record = next(records, None)
+    if first_record is None:
         print("❌ No data to export.")
         return
 
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=2)
+    with open(filename, "wb") as f:
+        f.write(b"[\n  ")
+        f.write(_dump_json_bytes(first_record).replace(b"\n", b"\n  "))
+        for record in records:
+            f.write(b",\n  ")
+            f.write(_dump_json_bytes(record).replace(b"\n", b"\n  "))
+        f.write(b"\n]")
 
     print(f"✅ JSON saved to {filename}")
 
@@ -756,53 +868,60 @@ def build_storage_audit(files: Iterable[dict], top_n: int = DEFAULT_AUDIT_TOP_N)
     """Build a read-only storage audit with cleanup opportunity estimates."""
 
     normalized_files = []
+    total_bytes = 0
+    included_count = 0
+    hardlink_files = []
+    sparse_files = []
+    by_category = {}
+    by_folder = {}
+    duplicate_groups = {}
+    # Normalize and aggregate in one pass; large scans make each extra walk expensive.
     for file in files:
         size_bytes = int(file.get("size_bytes", 0) or 0)
         mime_type = file.get("mimeType") or ""
-        normalized_files.append(
-            {
-                **file,
-                "name": file.get("name") or "Untitled",
-                "path": file.get("path") or "",
-                "size_bytes": size_bytes,
-                "mimeType": mime_type,
-                "category": file_category(mime_type),
-                "included": file.get("included", file.get("ownedByMe", True)),
-                "parents": file.get("parents") or ["root"],
-            }
-        )
-    for file in normalized_files:
-        if file["category"] == "video":
-            file["video_estimate"] = estimate_video_savings(file.get("media_probe"))
-        elif file["category"] == "audio":
-            file["audio_estimate"] = estimate_audio_savings(file.get("media_probe"))
-
-    total_bytes = sum(file["size_bytes"] for file in normalized_files if file.get("included"))
-    included_bytes = total_bytes
-    hardlink_files = [file for file in normalized_files if file.get("hardlink")]
-    sparse_files = [file for file in normalized_files if file.get("is_sparse")]
-    sparse_bytes_nominal = sum(file["size_bytes"] for file in sparse_files)
+        category = file_category(mime_type)
+        normalized = {
+            **file,
+            "name": file.get("name") or "Untitled",
+            "path": file.get("path") or "",
+            "size_bytes": size_bytes,
+            "mimeType": mime_type,
+            "category": category,
+            "included": file.get("included", file.get("ownedByMe", True)),
+            "parents": file.get("parents") or ["root"],
+        }
+        if category == "video":
+            normalized["video_estimate"] = estimate_video_savings(file.get("media_probe"))
+        elif category == "audio":
+            normalized["audio_estimate"] = estimate_audio_savings(file.get("media_probe"))
+        normalized_files.append(normalized)
+
+        included = normalized["included"]
+        counted_bytes = size_bytes if included else 0
+        if included:
+            total_bytes += size_bytes
+            included_count += 1
+        if normalized.get("hardlink"):
+            hardlink_files.append(normalized)
+        if normalized.get("is_sparse"):
+            sparse_files.append(normalized)
 
-    by_category = {}
-    for file in normalized_files:
-        category = file["category"]
         category_summary = by_category.setdefault(category, {"count": 0, "bytes": 0})
         category_summary["count"] += 1
-        if file.get("included"):
-            category_summary["bytes"] += file["size_bytes"]
+        category_summary["bytes"] += counted_bytes
+        for parent in normalized["parents"]:
+            folder_summary = by_folder.setdefault(parent, {"count": 0, "bytes": 0})
+            folder_summary["count"] += 1
+            folder_summary["bytes"] += counted_bytes
+
+        if size_bytes > 0 and included is not False and not normalized.get("is_sparse"):
+            duplicate_groups.setdefault((normalized["name"], size_bytes), []).append(normalized)
 
+    included_bytes = total_bytes
+    sparse_bytes_nominal = sum(file["size_bytes"] for file in sparse_files)
     by_category = dict(
         sorted(by_category.items(), key=lambda item: item[1]["bytes"], reverse=True)
     )
-
-    by_folder = {}
-    for file in normalized_files:
-        for parent in file["parents"]:
-            folder_summary = by_folder.setdefault(parent, {"count": 0, "bytes": 0})
-            folder_summary["count"] += 1
-            if file.get("included"):
-                folder_summary["bytes"] += file["size_bytes"]
-
     top_folders = [
         {"folder_id": folder_id, **summary}
         for folder_id, summary in sorted(
@@ -810,17 +929,6 @@ def build_storage_audit(files: Iterable[dict], top_n: int = DEFAULT_AUDIT_TOP_N)
         )[:top_n]
     ]
 
-    duplicate_groups = {}
-    for file in normalized_files:
-        if (
-            file["size_bytes"] <= 0
-            or file.get("included") is False
-            or file.get("is_sparse")
-        ):
-            continue
-        key = (file["name"], file["size_bytes"])
-        duplicate_groups.setdefault(key, []).append(file)
-
     duplicate_candidates = []
     duplicate_extra_ids = set()
     duplicate_member_ids = set()
@@ -874,7 +982,9 @@ def build_storage_audit(files: Iterable[dict], top_n: int = DEFAULT_AUDIT_TOP_N)
             {
                 "files": verified_group,
                 "verification_status": "verified",
-                "verification_algorithm": "sha256",
+                "verification_algorithm": verified_group[0]["duplicate_verification"].get(
+                    "algorithm", "sha256"
+                ),
                 "confidence": "high",
             }
             for verified_group in verified_groups.values()
@@ -913,17 +1023,19 @@ def build_storage_audit(files: Iterable[dict], top_n: int = DEFAULT_AUDIT_TOP_N)
             for file in group:
                 verification = file.get("duplicate_verification") or {}
                 content_hash = verification.get("content_hash")
+                algorithm = verification.get("algorithm") or "sha256"
                 if not content_hash:
                     try:
                         content_hash = file.get("cached_hash") or hash_file_sha256(file.get("path") or "")
                     except OSError:
                         continue
+                    algorithm = "sha256"
                 hash_groups.setdefault(content_hash, []).append(
                     {
                         **file,
                         "duplicate_verification": {
                             "status": "verified",
-                            "algorithm": "sha256",
+                            "algorithm": algorithm,
                             "content_hash": content_hash,
                         },
                     }
@@ -931,13 +1043,14 @@ def build_storage_audit(files: Iterable[dict], top_n: int = DEFAULT_AUDIT_TOP_N)
             for hash_group in hash_groups.values():
                 if len(hash_group) <= 1:
                     continue
+                algorithm = hash_group[0]["duplicate_verification"]["algorithm"]
                 add_duplicate_candidate(
                     hash_group[0]["name"],
                     size_bytes,
                     {
                         "files": hash_group,
                         "verification_status": "cross-name",
-                        "verification_algorithm": "sha256",
+                        "verification_algorithm": algorithm,
                         "confidence": "high",
                     },
                 )
@@ -950,6 +1063,7 @@ def build_storage_audit(files: Iterable[dict], top_n: int = DEFAULT_AUDIT_TOP_N)
         if file["category"] == "image"
         and file["size_bytes"] >= 1024 * 1024
         and file.get("included") is True
+        and exceeds_resolution(file)
         and (file.get("id") or file.get("path")) not in duplicate_extra_ids
     ]
     image_optimization_bytes = int(
@@ -997,7 +1111,7 @@ def build_storage_audit(files: Iterable[dict], top_n: int = DEFAULT_AUDIT_TOP_N)
         "summary": {
             "file_count": len(normalized_files),
             "total_bytes": total_bytes,
-            "included_count": sum(1 for file in normalized_files if file.get("included")),
+            "included_count": included_count,
             "included_bytes": included_bytes,
             "total_human": human_readable_size(total_bytes),
             "included_human": human_readable_size(included_bytes),
@@ -1165,8 +1279,7 @@ def export_storage_audit_dashboard(files: Iterable[dict]) -> dict:
     json_path = os.path.join(OUTPUT_DIR, "storage_audit.json")
     html_path = os.path.join(OUTPUT_DIR, "storage_audit.html")
 
-    with open(json_path, "w") as f:
-        json.dump(audit, f, indent=2)
+    _write_json(json_path, audit)
 
     with open(html_path, "w") as f:
         f.write(render_storage_audit_html(audit))
@@ -1287,16 +1400,13 @@ def generate_business_report(
 def reduce_image_to_1080p(input_path: str, output_path: str) -> tuple[int, int]:
     """Reduce ``input_path`` to ``HD_RESOLUTION`` and write the result."""
 
-    before_size = os.path.getsize(input_path)
-    with Image.open(input_path) as img:
-        img.thumbnail(HD_RESOLUTION, Image.LANCZOS)
-        img.save(output_path)
-
-    after_size = os.path.getsize(output_path)
-    print(f"🖼️ Reduced: {os.path.basename(input_path)}")
-    print(f"   Path: {output_path}")
-    print(f"   Size before: {human_readable_size(before_size)}")
-    print(f"   Size after:  {human_readable_size(after_size)}")
+    before_size, after_size = reduce_image_copy(input_path, output_path, HD_RESOLUTION)
+    print(
+        f"🖼️ Reduced: {os.path.basename(input_path)}\n"
+        f"   Path: {output_path}\n"
+        f"   Size before: {human_readable_size(before_size)}\n"
+        f"   Size after:  {human_readable_size(after_size)}"
+    )
     return before_size, after_size
 
 
@@ -1338,7 +1448,8 @@ def _write_image_copy(
             save_kwargs["quality"] = quality
         if img.mode in {"RGBA", "P"} and output_format == "JPEG":
             img = img.convert("RGB")
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        if os.path.dirname(output_path):
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
         if output_format:
             save_kwargs["format"] = output_format
         img.save(output_path, **save_kwargs)
@@ -1540,6 +1651,8 @@ def compute_perceptual_hashes(files: Iterable[dict]) -> list[dict]:
             continue
         try:
             with _PilImage.open(file.get("path") or "") as img:
+                # pHash only needs a 32x32 grayscale copy; let libjpeg decode at reduced scale.
+                img.draft("L", PERCEPTUAL_HASH_DRAFT_SIZE)
                 hashes.append({"id": file.get("id"), "phash": str(imagehash.phash(img))})
         except Exception:
             continue
@@ -1682,11 +1795,25 @@ def export_large_files(files: Iterable[dict], threshold_mb: float) -> None:
     """Export local files larger than ``threshold_mb`` to JSON."""
 
     threshold_bytes = threshold_mb * 1024 * 1024
-    large_files = [file for file in files if file["size_bytes"] > threshold_bytes]
-    if not large_files:
+    large_files = (file for file in files if file["size_bytes"] > threshold_bytes)
+    first_file = next(large_files, None)
+    if first_file is None:
         print("❌ No files found above the specified size.")
         return
-    export_to_json_file(large_files, f"files_above_{int(threshold_mb)}MB.json")
+    export_to_json_file(
+        itertools.chain((first_file,), large_files), f"files_above_{int(threshold_mb)}MB.json"
+    )
+
+
+def _is_resize_candidate(file: dict, min_size_bytes: float) -> bool:
+    """Return whether the CLI should write a reduced copy of ``file``."""
+
+    return (
+        file.get("mimeType") in SUPPORTED_IMAGE_MIME_TYPES
+        and file.get("size_bytes", 0) > min_size_bytes
+        and file.get("included") is not False
+        and exceeds_resolution(file)
+    )
 
 
 def reduce_local_images(files: Iterable[dict], min_size_mb: float, number_of_files: int) -> None:
@@ -1694,27 +1821,26 @@ def reduce_local_images(files: Iterable[dict], min_size_mb: float, number_of_fil
 
     os.makedirs(REDUCED_DIR, exist_ok=True)
     min_size_bytes = min_size_mb * 1024 * 1024
-    image_files = [
-        file
-        for file in files
-        if file.get("mimeType", "").startswith("image/")
-        and file.get("size_bytes", 0) > min_size_bytes
-    ]
+    image_files = [file for file in files if _is_resize_candidate(file, min_size_bytes)]
     if not image_files:
         print("❌ No image files found above the specified size.")
         return
 
     total_bytes_saved = 0
-    for file in image_files[:number_of_files]:
-        source_path = file["path"]
-        relative_id = file.get("id") or file["name"]
-        output_path = os.path.join(REDUCED_DIR, relative_id)
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        try:
-            before, after = reduce_image_copy(source_path, output_path)
-            total_bytes_saved += max(before - after, 0)
-        except Exception as error:
-            print(f"⚠️ Skipped image {source_path}: {error}")
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        future_map = {}
+        for file in image_files[:number_of_files]:
+            source_path = file["path"]
+            relative_id = file.get("id") or file["name"]
+            output_path = os.path.join(REDUCED_DIR, relative_id)
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            future_map[executor.submit(reduce_image_copy, source_path, output_path)] = source_path
+        for future in as_completed(future_map):
+            try:
+                before, after = future.result()
+                total_bytes_saved += max(before - after, 0)
+            except Exception as error:
+                print(f"⚠️ Skipped image {future_map[future]}: {error}")
 
     print(f"\n💾 Estimated space saved by reduced copies: {human_readable_size(total_bytes_saved)}")
 
@@ -1731,11 +1857,13 @@ def find_duplicates(files: Iterable[dict]) -> dict:
 
     print(f"⚠️ Found {opportunities['duplicate_count']} duplicate candidate files.")
     print(f"💾 Estimated recoverable space: {opportunities['duplicate_human']}")
-    for group in duplicates:
-        print(
+    print(
+        "\n".join(
             f"   {group['name']} - {group['copies']} copies, "
             f"{human_readable_size(group['recoverable_bytes'])} recoverable"
+            for group in duplicates
         )
+    )
     print("ℹ️ No files were deleted. Review the storage audit before removing files.")
     return audit
 
@@ -22,6 +22,7 @@ from cloudsaver._core_impl import (
     IMAGE_OPTIMIZATION_SAVINGS_RATE,
     LARGE_FILE_THRESHOLD_BYTES,
     MEDIA_ANALYSIS,
+    ORJSON_AVAILABLE,
     OUTPUT_DIR,
     OXIPNG_AVAILABLE,
     PERCEPTUAL_HASH_AVAILABLE,
@@ -37,6 +38,7 @@ from cloudsaver._core_impl import (
 
 def _sync_patchable_globals() -> None:
     _impl.OUTPUT_DIR = OUTPUT_DIR
+    _impl.ORJSON_AVAILABLE = ORJSON_AVAILABLE
     _impl.PERCEPTUAL_HASH_AVAILABLE = PERCEPTUAL_HASH_AVAILABLE
 
 
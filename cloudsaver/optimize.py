@@ -8,6 +8,7 @@ from cloudsaver._core_impl import (
     OXIPNG_AVAILABLE,
     attach_reduction_estimates,
     estimate_reduction_for_file,
+    exceeds_resolution,
     reduce_image_to_1080p,
     reduce_image_copy,
     _write_image_copy,
@@ -28,6 +29,7 @@ __all__ = [
     'OXIPNG_AVAILABLE',
     'attach_reduction_estimates',
     'estimate_reduction_for_file',
+    'exceeds_resolution',
     'reduce_image_to_1080p',
     'reduce_image_copy',
     'reduce_selected_images',
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Iterable
 
@@ -12,7 +13,30 @@ from cloudsaver.provider_adapters import (
 )
 from cloudsaver.scan import scan_local_folder
 
-DRIVE_FILE_FIELDS = "files(id,name,size,mimeType,md5Checksum,parents,modifiedTime,trashed,starred)"
+# Optional: install with `python -m pip install "cloudsaver[sidecar]"`.
+try:
+    from google.oauth2.credentials import Credentials
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.discovery import build
+    from googleapiclient.http import build_http
+
+    GOOGLE_API_AVAILABLE = True
+except ImportError:
+    Credentials = None
+    AuthorizedHttp = None
+    build = None
+    build_http = None
+    GOOGLE_API_AVAILABLE = False
+
+DRIVE_FILE_FIELDS = (
+    "files(id,name,size,mimeType,md5Checksum,parents,modifiedTime,trashed,starred,"
+    "imageMediaMetadata(width,height))"
+)
+# Drive's files.list maximum; the default of 100 costs ten times the round trips.
+DRIVE_LIST_PAGE_SIZE = 1000
+DRIVE_SERVICE_CACHE_SIZE = 4
+# googleapiclient services share an httplib2 connection that is not thread-safe.
+_drive_services = threading.local()
 
 
 class LocalFolderAdapter:
@@ -71,7 +95,7 @@ class GoogleDriveRemoteAdapter:
             response = (
                 service.files()
                 .list(
-                    pageSize=1000,
+                    pageSize=DRIVE_LIST_PAGE_SIZE,
                     fields=f"nextPageToken,{DRIVE_FILE_FIELDS}",
                     q="trashed=false",
                     pageToken=page_token,
@@ -147,22 +171,52 @@ def google_drive_file_to_provider_file(file: dict, source_id: str) -> ProviderFi
         raw={
             "drive_id": raw_id,
             "parents": file.get("parents", []),
+            **google_drive_image_dimensions(file),
         },
     )
 
 
+def google_drive_image_dimensions(file: dict) -> dict:
+    metadata = file.get("imageMediaMetadata") or {}
+    if not metadata.get("width") or not metadata.get("height"):
+        return {}
+    return {"width": int(metadata["width"]), "height": int(metadata["height"])}
+
+
 def normalize_provider_file_id(source_type: str, source_id: str, raw_id: str) -> str:
     safe_raw = raw_id.replace("\\", "/")
     return f"{source_type}:{source_id}:{safe_raw}"
 
 
 def google_drive_service(access_token: str):
+    """Return a Drive client for ``access_token``, reused within the calling thread."""
+
     if not access_token:
         raise ValueError("A Google Drive access token is required.")
-    from google.oauth2.credentials import Credentials
-    from googleapiclient.discovery import build
-
-    return build("drive", "v3", credentials=Credentials(token=access_token), cache_discovery=False)
+    services = getattr(_drive_services, "by_token", None)
+    if services is None:
+        services = _drive_services.by_token = {}
+    service = services.get(access_token)
+    if service is not None:
+        return service
+    if not GOOGLE_API_AVAILABLE:
+        raise RuntimeError("Google Drive API client is not available.")
+
+    # One keep-alive connection per thread, shared by every token's client.
+    http = getattr(_drive_services, "http", None)
+    if http is None:
+        http = _drive_services.http = build_http()
+    service = build(
+        "drive",
+        "v3",
+        http=AuthorizedHttp(Credentials(token=access_token), http=http),
+        cache_discovery=False,
+        static_discovery=True,
+    )
+    if len(services) >= DRIVE_SERVICE_CACHE_SIZE:
+        services.pop(next(iter(services)))
+    services[access_token] = service
+    return service
 
 
 PROVIDER_ADAPTERS: dict[str, ProviderAdapter] = {
@@ -1,6 +1,7 @@
 from cloudsaver import _core_impl as _impl
 from cloudsaver._core_impl import (
     APP_DATA_DIR,
+    ORJSON_AVAILABLE,
     OUTPUT_DIR,
     render_storage_audit_html,
     export_storage_audit_dashboard,
@@ -15,6 +16,7 @@ from cloudsaver._core_impl import (
 
 def _sync_globals() -> None:
     _impl.OUTPUT_DIR = OUTPUT_DIR
+    _impl.ORJSON_AVAILABLE = ORJSON_AVAILABLE
 
 
 def export_to_json_file(data, filename):
@@ -28,6 +30,7 @@ def export_storage_audit_dashboard(files):
 
 __all__ = [
     'APP_DATA_DIR',
+    'ORJSON_AVAILABLE',
     'OUTPUT_DIR',
     'render_storage_audit_html',
     'export_storage_audit_dashboard',
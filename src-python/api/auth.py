@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import os
 import secrets
 from urllib.parse import urlencode
 
+import httpx
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
@@ -13,6 +15,7 @@ router = APIRouter()
 GOOGLE_CLIENT_ID = os.environ.get("CLOUDSAVER_GOOGLE_CLIENT_ID", "")
 REDIRECT_URI = "cloudsaver://oauth/callback"
 _pending: dict[str, str] = {}
+_refresh_in_flight: dict[str, asyncio.Future] = {}
 
 
 @router.get("/health")
@@ -65,8 +68,6 @@ class RefreshRequest(BaseModel):
 
 @router.post("/gdrive/exchange")
 async def gdrive_exchange(req: TokenExchangeRequest):
-    import httpx
-
     verifier = _pending.pop(req.state, None)
     if not verifier:
         raise HTTPException(status_code=400, detail="Invalid or expired state")
@@ -95,13 +96,21 @@ async def gdrive_exchange(req: TokenExchangeRequest):
 
 @router.post("/gdrive/refresh")
 async def gdrive_refresh(req: RefreshRequest):
-    import httpx
+    # Concurrent callers holding the same refresh token share one token request.
+    refresh = _refresh_in_flight.get(req.refresh_token)
+    if refresh is None:
+        refresh = asyncio.ensure_future(_refresh_access_token(req.refresh_token))
+        _refresh_in_flight[req.refresh_token] = refresh
+        refresh.add_done_callback(lambda _: _refresh_in_flight.pop(req.refresh_token, None))
+    return await asyncio.shield(refresh)
+
 
+async def _refresh_access_token(refresh_token: str) -> dict:
     async with httpx.AsyncClient() as client:
         response = await client.post(
             "https://oauth2.googleapis.com/token",
             data={
-                "refresh_token": req.refresh_token,
+                "refresh_token": refresh_token,
                 "client_id": GOOGLE_CLIENT_ID,
                 "grant_type": "refresh_token",
             },
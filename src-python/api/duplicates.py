@@ -154,9 +154,11 @@ def _mtime(file: dict) -> float:
 def _hash_md5_local(path: str) -> str | None:
     try:
         digest = hashlib.md5()
-        with open(path, "rb") as file:
-            for chunk in iter(lambda: file.read(1024 * 1024), b""):
-                digest.update(chunk)
+        buffer = bytearray(1024 * 1024)
+        view = memoryview(buffer)
+        with open(path, "rb", buffering=0) as file:
+            while size := file.readinto(buffer):
+                digest.update(view[:size])
         return digest.hexdigest()
     except OSError:
         return None
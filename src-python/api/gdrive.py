@@ -9,11 +9,18 @@ from fastapi import APIRouter, Header, HTTPException, WebSocket, WebSocketDiscon
 from pydantic import BaseModel, Field
 
 from cloudsaver.audit import build_storage_audit
+from cloudsaver.duplicates import attach_duplicate_verification
+from cloudsaver.provider_registry import (
+    DRIVE_FILE_FIELDS,
+    DRIVE_LIST_PAGE_SIZE,
+    google_drive_image_dimensions,
+    google_drive_service,
+)
 
 router = APIRouter()
 _jobs: dict[str, dict] = {}
 _jobs_lock = threading.Lock()
-DRIVE_FILE_FIELDS = "files(id,name,size,mimeType,md5Checksum,parents,modifiedTime,trashed,starred)"
+DRIVE_BATCH_LIMIT = 100
 
 
 @router.get("/health")
@@ -30,6 +37,11 @@ class DriveTokenRequest(BaseModel):
     access_token: str = Field(min_length=1)
 
 
+class DriveTrashRequest(BaseModel):
+    access_token: str = Field(min_length=1)
+    file_ids: list[str] = Field(min_length=1)
+
+
 @router.post("/scan/start")
 async def start_drive_scan(req: DriveScanRequest):
     job_id = str(uuid.uuid4())
@@ -80,6 +92,18 @@ async def trash_file_post(file_id: str, req: DriveTokenRequest):
     return {"status": "trashed", "file_id": file_id}
 
 
+@router.post("/files/trash")
+async def trash_files(req: DriveTrashRequest):
+    results = _trash_drive_files(req.file_ids, req.access_token)
+    response = {
+        "results": results,
+        "trashed_count": sum(1 for result in results if result["status"] == "trashed"),
+    }
+    if response["trashed_count"] < len(results):
+        raise HTTPException(status_code=502, detail=response)
+    return response
+
+
 @router.post("/file/{file_id}/webview-link")
 async def webview_link(file_id: str, req: DriveTokenRequest):
     service = _drive_service(req.access_token)
@@ -97,10 +121,7 @@ def _update_job(job_id: str, updates: dict):
 def _drive_service(access_token: str):
     if not access_token:
         raise HTTPException(status_code=401, detail="A Google Drive access token is required.")
-    from google.oauth2.credentials import Credentials
-    from googleapiclient.discovery import build
-
-    return build("drive", "v3", credentials=Credentials(token=access_token), cache_discovery=False)
+    return google_drive_service(access_token)
 
 
 def _run_drive_scan(job_id: str, req: DriveScanRequest):
@@ -117,7 +138,7 @@ def _run_drive_scan(job_id: str, req: DriveScanRequest):
             response = (
                 service.files()
                 .list(
-                    pageSize=1000,
+                    pageSize=DRIVE_LIST_PAGE_SIZE,
                     fields=f"nextPageToken,{DRIVE_FILE_FIELDS}",
                     q="trashed=false",
                     pageToken=page_token,
@@ -138,6 +159,7 @@ def _run_drive_scan(job_id: str, req: DriveScanRequest):
             if not page_token:
                 break
 
+        files = attach_duplicate_verification(files)
         audit = build_storage_audit(files)
         result = {
             "source_id": req.source_id,
@@ -178,9 +200,37 @@ def _normalize_drive_file(file: dict, source_id: str) -> dict:
         "parents": file.get("parents", []),
         "included": True,
         "drive_id": file["id"],
+        **google_drive_image_dimensions(file),
     }
 
 
 def _trash_drive_file(file_id: str, access_token: str):
     service = _drive_service(access_token)
     service.files().update(fileId=file_id, body={"trashed": True}).execute()
+
+
+def _trash_drive_files(file_ids: list[str], access_token: str) -> list[dict]:
+    # Drive batches metadata requests only; media uploads and downloads cannot be batched.
+    service = _drive_service(access_token)
+    results_by_id: dict[str, dict] = {}
+
+    def on_trashed(request_id, response, exception):
+        if exception is not None:
+            results_by_id[request_id] = {
+                "file_id": request_id,
+                "status": "failed",
+                "error": str(exception),
+            }
+        else:
+            results_by_id[request_id] = {"file_id": request_id, "status": "trashed"}
+
+    unique_ids = list(dict.fromkeys(file_ids))
+    for start in range(0, len(unique_ids), DRIVE_BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=on_trashed)
+        for file_id in unique_ids[start : start + DRIVE_BATCH_LIMIT]:
+            batch.add(
+                service.files().update(fileId=file_id, body={"trashed": True}),
+                request_id=file_id,
+            )
+        batch.execute()
+    return [results_by_id[file_id] for file_id in unique_ids]
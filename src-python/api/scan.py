@@ -207,8 +207,7 @@ def _run_provider_scan(job_id: str, req: ProviderScanRequest):
             access_token=req.access_token,
             options={"exclude_globs": req.exclude_globs},
         )
-        provider_files = list(adapter.scan(context, progress_callback=on_progress))
-        files = [file.to_scan_dict() for file in provider_files]
+        files = [file.to_scan_dict() for file in adapter.scan(context, progress_callback=on_progress)]
         _update_job(job_id, {"stage": "Hashing duplicates"})
         files = attach_duplicate_verification(files)
         _update_job(job_id, {"stage": "Estimating savings"})
@@ -52,10 +52,17 @@ export function Duplicates() {
         }),
       ),
     )
+    const driveIdsBySource: Record<string, string[]> = {}
+    for (const file of driveFiles) {
+      const fileIds = driveIdsBySource[file.source_id] || []
+      fileIds.push(file.drive_id as string)
+      driveIdsBySource[file.source_id] = fileIds
+    }
     await Promise.all(
-      driveFiles.map((file) =>
-        api.post(`/gdrive/file/${file.drive_id}/trash`, {
-          access_token: sources.find((source) => source.id === file.source_id)?.accessToken || '',
+      Object.entries(driveIdsBySource).map(([sourceId, fileIds]) =>
+        api.post('/gdrive/files/trash', {
+          access_token: sources.find((source) => source.id === sourceId)?.accessToken || '',
+          file_ids: fileIds,
         }),
       ),
     )
@@ -30,3 +30,102 @@ async def test_sources_detected():
         response = await client.get("/sources/detected")
     assert response.status_code == 200
     assert "sources" in response.json()
+
+
+class FakeDriveBatch:
+    def __init__(self, callback, failing_ids, executed_batches):
+        self.callback = callback
+        self.failing_ids = failing_ids
+        self.executed_batches = executed_batches
+        self.request_ids = []
+
+    def add(self, request, request_id):
+        self.request_ids.append(request_id)
+
+    def execute(self):
+        self.executed_batches.append(list(self.request_ids))
+        for request_id in self.request_ids:
+            if request_id in self.failing_ids:
+                self.callback(request_id, None, RuntimeError("insufficientFilePermissions"))
+            else:
+                self.callback(request_id, {}, None)
+
+
+class FakeDriveFiles:
+    def update(self, fileId, body):
+        return (fileId, body)
+
+
+class FakeDriveService:
+    def __init__(self, failing_ids=()):
+        self.failing_ids = set(failing_ids)
+        self.executed_batches = []
+
+    def new_batch_http_request(self, callback):
+        return FakeDriveBatch(callback, self.failing_ids, self.executed_batches)
+
+    def files(self):
+        return FakeDriveFiles()
+
+
+def test_trash_drive_files_batches_metadata_updates(monkeypatch):
+    from api import gdrive
+
+    service = FakeDriveService()
+    monkeypatch.setattr(gdrive, "_drive_service", lambda access_token: service)
+    file_ids = [f"file-{index}" for index in range(150)]
+
+    results = gdrive._trash_drive_files(file_ids, "token")
+
+    assert [len(batch) for batch in service.executed_batches] == [100, 50]
+    assert [result["file_id"] for result in results] == file_ids
+    assert {result["status"] for result in results} == {"trashed"}
+
+
+@pytest.mark.asyncio
+async def test_trash_drive_files_reports_failed_updates(monkeypatch):
+    from api import gdrive
+
+    service = FakeDriveService(failing_ids={"locked"})
+    monkeypatch.setattr(gdrive, "_drive_service", lambda access_token: service)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/gdrive/files/trash",
+            json={"access_token": "token", "file_ids": ["ok", "locked"]},
+        )
+
+    assert response.status_code == 502
+    detail = response.json()["detail"]
+    assert detail["trashed_count"] == 1
+    assert detail["results"][1] == {
+        "file_id": "locked",
+        "status": "failed",
+        "error": "insufficientFilePermissions",
+    }
+
+
+@pytest.mark.asyncio
+async def test_gdrive_refresh_shares_in_flight_request(monkeypatch):
+    import asyncio
+
+    from api import auth
+
+    calls = []
+
+    async def fake_refresh(refresh_token):
+        calls.append(refresh_token)
+        await asyncio.sleep(0.01)
+        return {"access_token": "fresh", "expires_in": 3600}
+
+    monkeypatch.setattr(auth, "_refresh_access_token", fake_refresh)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        responses = await asyncio.gather(
+            *(
+                client.post("/auth/gdrive/refresh", json={"refresh_token": "refresh"})
+                for _ in range(5)
+            )
+        )
+
+    assert calls == ["refresh"]
+    assert {response.json()["access_token"] for response in responses} == {"fresh"}
+    assert auth._refresh_in_flight == {}
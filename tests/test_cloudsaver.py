@@ -3,14 +3,26 @@ import os
 import pytest
 from unittest.mock import patch
 
-from cloudsaver.audit import build_storage_audit, estimate_monthly_storage_cost_usd
+from cloudsaver.audit import build_storage_audit, estimate_monthly_storage_cost_usd, human_readable_size
 from cloudsaver.duplicates import attach_duplicate_verification, find_perceptual_duplicates
 from cloudsaver.media import estimate_audio_savings, estimate_video_savings
-from cloudsaver.optimize import convert_image_format, estimate_reduction_for_file, reduce_selected_images
+from cloudsaver.optimize import (
+    convert_image_format,
+    estimate_reduction_for_file,
+    reduce_image_to_1080p,
+    reduce_local_images,
+    reduce_selected_images,
+)
 from cloudsaver.quarantine import quarantine_selected_files, restore_quarantine
-from cloudsaver.reports import export_storage_audit_dashboard, export_to_json_file, generate_business_report
+from cloudsaver.reports import (
+    ORJSON_AVAILABLE,
+    export_storage_audit_dashboard,
+    export_to_json_file,
+    generate_business_report,
+)
 from cloudsaver.scan import hash_file_partial, is_protected_path, scan_local_folder
 from cloudsaver.history import list_scan_history, save_scan_history
+from cloudsaver.provider_registry import google_drive_file_to_provider_file
 from cloudsaver.web_server import reveal_path_in_platform_file_manager
 
 
@@ -28,6 +40,44 @@ def test_export_to_json_file_creates_file(tmp_path):
         assert saved == data
 
 
+def test_export_to_json_file_falls_back_to_stdlib_json(tmp_path):
+    data = [{"name": "file1", "size_bytes": 123}]
+    output_dir = tmp_path / "output"
+    with patch("cloudsaver.reports.OUTPUT_DIR", str(output_dir)), patch(
+        "cloudsaver.reports.ORJSON_AVAILABLE", False
+    ):
+        export_to_json_file(data, "fallback.json")
+
+    with open(output_dir / "fallback.json") as f:
+        assert json.load(f) == data
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_export_to_json_file_handles_non_ascii_and_int_keys(tmp_path, use_orjson):
+    if use_orjson and not ORJSON_AVAILABLE:
+        pytest.skip("orjson is not installed")
+    data = [{"name": "café.jpg", "counts": {1: 2}}]
+    output_dir = tmp_path / "output"
+    with patch("cloudsaver.reports.OUTPUT_DIR", str(output_dir)), patch(
+        "cloudsaver.reports.ORJSON_AVAILABLE", use_orjson
+    ):
+        export_to_json_file(data, "unicode.json")
+
+    with open(output_dir / "unicode.json", encoding="utf-8") as f:
+        assert json.load(f) == [{"name": "café.jpg", "counts": {"1": 2}}]
+
+
+def test_export_to_json_file_streams_generator_input(tmp_path):
+    data = [{"name": f"file{index}", "size_bytes": index} for index in range(3)]
+    output_dir = tmp_path / "output"
+    with patch("cloudsaver.reports.OUTPUT_DIR", str(output_dir)):
+        export_to_json_file((record for record in data), "streamed.json")
+
+    saved_text = (output_dir / "streamed.json").read_text()
+    assert json.loads(saved_text) == data
+    assert saved_text == json.dumps(data, indent=2)
+
+
 def test_export_to_json_file_no_data(capsys, tmp_path):
     filename = "empty.json"
     output_dir = tmp_path / "output"
@@ -232,10 +282,45 @@ def test_build_storage_audit_summarizes_opportunities():
     assert audit["top_folders"][0]["folder_id"] == "videos"
 
 
+def test_build_storage_audit_skips_images_already_within_hd():
+    one_mb = 1024 * 1024
+    files = [
+        {
+            "id": "small.jpg",
+            "name": "small.jpg",
+            "size_bytes": 3 * one_mb,
+            "mimeType": "image/jpeg",
+            "width": 1600,
+            "height": 900,
+        },
+        {
+            "id": "large.jpg",
+            "name": "large.jpg",
+            "size_bytes": 6 * one_mb,
+            "mimeType": "image/jpeg",
+            "width": 4032,
+            "height": 3024,
+        },
+        {"id": "unknown.jpg", "name": "unknown.jpg", "size_bytes": 2 * one_mb, "mimeType": "image/jpeg"},
+    ]
+
+    audit = build_storage_audit(files)
+
+    assert audit["opportunities"]["image_optimization_count"] == 2
+
+
 def test_estimate_monthly_storage_cost_usd():
     assert estimate_monthly_storage_cost_usd(100 * 1024 * 1024 * 1024) == 2.5
 
 
+def test_human_readable_size_unit_boundaries():
+    assert human_readable_size(0) == "0.00 B"
+    assert human_readable_size(1023) == "1023.00 B"
+    assert human_readable_size(1024) == "1.00 KB"
+    assert human_readable_size(1536 * 1024) == "1.50 MB"
+    assert human_readable_size(2048 * 1024**5) == "2048.00 PB"
+
+
 def test_scan_history_persists_recent_scans(tmp_path):
     db_path = tmp_path / "history.sqlite3"
     audit = build_storage_audit(
@@ -315,6 +400,62 @@ def test_build_storage_audit_detects_cross_name_duplicates(tmp_path):
     assert audit["duplicate_candidates"][0]["confidence"] == "high"
 
 
+def _drive_md5_file(file_id, name, md5):
+    return {
+        "id": file_id,
+        "name": name,
+        "path": name,
+        "size_bytes": 4096,
+        "mimeType": "image/jpeg",
+        "md5": md5,
+        "included": True,
+        "parents": ["root"],
+    }
+
+
+def test_provider_md5_checksums_verify_duplicates_without_reading_files():
+    files = [
+        _drive_md5_file("a", "holiday.jpg", "aaaa"),
+        _drive_md5_file("b", "holiday (1).jpg", "aaaa"),
+        _drive_md5_file("c", "holiday.jpg", "bbbb"),
+        {**_drive_md5_file("d", "holiday (2).jpg", "aaaa"), "included": False},
+    ]
+
+    no_reads = AssertionError("provider md5 files must not be read")
+    with patch("cloudsaver._core_impl.hash_file_sha256", side_effect=no_reads), patch(
+        "cloudsaver._core_impl.hash_file_partial", side_effect=no_reads
+    ):
+        verified_files = attach_duplicate_verification(files)
+        audit = build_storage_audit(verified_files)
+
+    assert verified_files[2]["duplicate_verification"] == {
+        "status": "rejected",
+        "algorithm": "md5",
+        "content_hash": "bbbb",
+    }
+    assert verified_files[3] is files[3]
+    assert audit["opportunities"]["duplicate_count"] == 1
+    candidate = audit["duplicate_candidates"][0]
+    assert candidate["verification_algorithm"] == "md5"
+    assert {file["id"] for file in candidate["files"]} == {"a", "b"}
+
+
+def test_provider_md5_mismatch_rejects_same_name_and_size():
+    files = [
+        _drive_md5_file("a", "x.jpg", "1111"),
+        _drive_md5_file("b", "x.jpg", "2222"),
+    ]
+
+    no_reads = AssertionError("provider md5 files must not be read")
+    with patch("cloudsaver._core_impl.hash_file_sha256", side_effect=no_reads), patch(
+        "cloudsaver._core_impl.hash_file_partial", side_effect=no_reads
+    ):
+        audit = build_storage_audit(attach_duplicate_verification(files))
+
+    assert audit["opportunities"]["duplicate_count"] == 0
+    assert audit["duplicate_candidates"] == []
+
+
 def test_partial_hash_rejects_same_name_size_different_content(tmp_path):
     first_dir = tmp_path / "first"
     second_dir = tmp_path / "second"
@@ -466,6 +607,55 @@ def test_reduce_selected_images_creates_reduced_copy(tmp_path):
     assert result["total_saved_bytes"] > 0
 
 
+def test_reduce_image_to_1080p_writes_optimized_hd_copy(tmp_path):
+    from PIL import Image
+
+    image_path = tmp_path / "large.jpg"
+    output_path = tmp_path / "reduced" / "large.jpg"
+    Image.new("RGB", (3000, 2000), color=(45, 90, 120)).save(image_path, quality=95)
+
+    before_size, after_size = reduce_image_to_1080p(str(image_path), str(output_path))
+
+    with Image.open(output_path) as reduced:
+        assert reduced.size == (1620, 1080)
+    assert after_size == output_path.stat().st_size
+    assert after_size < before_size
+
+
+def test_reduce_local_images_only_reduces_resize_candidates(tmp_path):
+    from PIL import Image
+
+    root = tmp_path / "scan"
+    output_dir = tmp_path / "reduced"
+    root.mkdir()
+
+    def image_file(name, mime_type, **extra):
+        path = root / name
+        Image.new("RGB", (2200, 1400), color=(45, 90, 120)).save(path)
+        return {
+            "id": name,
+            "name": name,
+            "path": str(path),
+            "size_bytes": path.stat().st_size,
+            "mimeType": mime_type,
+            "included": True,
+            "parents": ["root"],
+            **extra,
+        }
+
+    files = [
+        image_file("large.jpg", "image/jpeg"),
+        image_file("animation.gif", "image/gif"),
+        image_file("hardlink.jpg", "image/jpeg", included=False),
+        image_file("already-hd.jpg", "image/jpeg", width=1280, height=720),
+    ]
+
+    with patch("cloudsaver._core_impl.REDUCED_DIR", str(output_dir)):
+        reduce_local_images(files, min_size_mb=0, number_of_files=10)
+
+    assert sorted(path.name for path in output_dir.iterdir()) == ["large.jpg"]
+
+
 def test_convert_image_format_creates_webp_copy(tmp_path):
     from PIL import Image, features
 
@@ -640,3 +830,15 @@ def test_reveal_path_opens_containing_location(tmp_path):
         reveal_path_in_platform_file_manager(str(file_path))
 
     popen.assert_called_once()
+
+
+def test_google_drive_scan_records_keep_raw_file_ids():
+    record = google_drive_file_to_provider_file(
+        {"id": "abc123", "name": "photo.jpg", "size": "2048", "md5Checksum": "d41d8cd9"},
+        "drive-source",
+    ).to_scan_dict()
+
+    assert record["drive_id"] == "abc123"
+    assert record["provider_file_id"] == "abc123"
+    assert record["id"] == "google_drive:drive-source:abc123"
+    assert "drive.google.com" not in (record["path"] or "")